@@ -6,40 +6,31 @@ This script shows how to define dataclasses with different field types
 and use DataclassArgParser to create a command-line interface.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import Annotated
 
-from dataclass_argparser import DataclassArgParser
+from dataclass_argparser import DataclassArgParser, Help
 
 
-@dataclass
+@dataclass(frozen=True)
 class SimulationConfig:
     """Configuration for simulation parameters."""
 
-    name: str = field(metadata={"help": "Name of the simulation"})
-    temperature: float = field(
-        default=27.0, metadata={"help": "Temperature in Celsius"}
-    )
-    num_simulations: int = field(
-        default=100, metadata={"help": "Number of simulations to run"}
-    )
-    output_dir: str = field(
-        default="/tmp/output", metadata={"help": "Output directory path"}
-    )
-    verbose: bool = field(default=False, metadata={"help": "Enable verbose output"})
+    name: Annotated[str, Help("Name of the simulation")]
+    temperature: Annotated[float, Help("Temperature in Celsius")] = 27.0
+    num_simulations: Annotated[int, Help("Number of simulations to run")] = 100
+    output_dir: Annotated[str, Help("Output directory path")] = "/tmp/output"
+    verbose: Annotated[bool, Help("Enable verbose output")] = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProcessConfig:
     """Configuration for process parameters."""
 
     # Updated to accept arbitrary process type strings to match example_config.json
-    process_type: str = field(
-        default="typeA", metadata={"help": "Type of processing to use"}
-    )
-    max_workers: int = field(
-        default=4, metadata={"help": "Maximum number of worker processes"}
-    )
-    timeout: float = field(default=300.0, metadata={"help": "Timeout in seconds"})
+    process_type: Annotated[str, Help("Type of processing to use")] = "typeA"
+    max_workers: Annotated[int, Help("Maximum number of worker processes")] = 4
+    timeout: Annotated[float, Help("Timeout in seconds")] = 300.0
 
 
 def main():
@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from dataclass_argparser import DataclassArgParser
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppConfig:
     name: str = field(default="example", metadata={"help": "Application name"})
     repeats: int = field(default=1, metadata={"help": "Number of repeats"})
@@ -15,14 +15,14 @@ from dataclasses import dataclass, field
 from dataclass_argparser import DataclassArgParser
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConfigurationA:
     path: str = field(default="/default/path", metadata={"help": "A filesystem path"})
     float_field: float = field(default=0.0, metadata={"help": "A float field"})
     int_field: int = field(default=0, metadata={"help": "An integer field"})
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConfigurationB:
     int_field_2: int = field(default=0, metadata={"help": "Another integer field"})
     string_field: str = field(default="", metadata={"help": "A string field"})
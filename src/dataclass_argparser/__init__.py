@@ -7,7 +7,30 @@ providing type-based metavars for better user experience. It also supports loadi
 configuration from YAML or JSON files.
 """
 
-from .parser import DataclassArgParser
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .parser import DataclassArgParser, Help
 
 __version__ = "1.0.0"
-__all__ = ["DataclassArgParser"]
+__all__ = ["DataclassArgParser", "Help"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily import public names so `import dataclass_argparser` stays cheap.
+
+    The parser module (and its argparse/json/yaml dependencies) is only loaded
+    the first time one of its names is accessed.
+    """
+    if name in __all__:
+        from . import parser
+
+        value = getattr(parser, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
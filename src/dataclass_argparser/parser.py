@@ -10,20 +10,17 @@ configuration from YAML or JSON files.
 import argparse
 import ast
 import dataclasses
+import functools
+import itertools
 import json
 import os
+import sys
+import types
 import typing
-from typing import Any, Literal, Optional, Type, Union, cast
+from typing import Annotated, Any, Literal, NamedTuple, Optional, Type, Union, cast
 
 from result import Err, Ok, Result
 
-try:
-    import yaml
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
-
 try:
     from pydantic import BaseModel
     from pydantic_core import PydanticUndefined
@@ -35,7 +32,21 @@ except ImportError:
     PydanticUndefined = None  # type: ignore[misc, assignment]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
+class Help:
+    """
+    Help text for a field, attached through `typing.Annotated`.
+
+    Example:
+        @dataclass
+        class Config:
+            name: Annotated[str, Help("The name to use")] = "test"
+    """
+
+    text: str
+
+
+@dataclasses.dataclass(frozen=True)
 class _SchemaField:
     """Unified field representation for dataclasses and Pydantic models."""
 
@@ -44,6 +55,104 @@ class _SchemaField:
     default: Any = dataclasses.MISSING
     default_factory: Any = dataclasses.MISSING
     metadata: dict[str, Any] = dataclasses.field(default_factory=dict)
+    # help text resolved once from the metadata, so argument registration
+    # does not need to probe the metadata mapping for every field
+    help: str = ""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml() -> Any:
+    """
+    Import PyYAML on first use and return the module, or None if it is not installed.
+
+    Deferring the import keeps `import dataclass_argparser` and JSON-only runs from
+    paying for PyYAML.
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+@functools.lru_cache(maxsize=None)
+def _get_orjson() -> Any:
+    """
+    Import orjson on first use and return the module, or None if it is not installed.
+
+    orjson is an optional, faster drop-in for decoding JSON config files.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _json_loads(text: str) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+
+    Documents orjson rejects (such as NaN literals or integers wider than 64
+    bits) are retried with the standard library decoder, so the accepted input
+    does not depend on orjson. Invalid JSON raises `json.JSONDecodeError`.
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _find_help(metadata: typing.Iterable[Any]) -> str:
+    """Return the text of the first `Help` marker in metadata, or ""."""
+    for item in metadata:
+        if isinstance(item, Help):
+            return item.text
+    return ""
+
+
+def _split_annotated(type_hint: Any) -> tuple[Any, str]:
+    """
+    Strip `Annotated[T, ...]` from a field type.
+
+    Returns the underlying type and the text of any `Help` marker attached to it
+    ("" if there is none). Other types are returned unchanged.
+    """
+    if typing.get_origin(type_hint) is Annotated:
+        base_type, *metadata = typing.get_args(type_hint)
+        return base_type, _find_help(metadata)
+    return type_hint, ""
+
+
+_F = typing.TypeVar("_F", bound=typing.Callable[..., Any])
+
+
+def _memoize_hashable(maxsize: int) -> typing.Callable[[_F], _F]:
+    """
+    Memoize a function of type annotations with `functools.lru_cache`.
+
+    Annotations are not always hashable (e.g. `Annotated[int, {"unit": "s"}]`
+    or a Literal of unhashable values); those calls bypass the cache and run
+    the function directly.
+    """
+
+    def decorator(func: _F) -> _F:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            try:
+                return cached(*args)
+            except TypeError:
+                # Unhashable argument
+                return func(*args)
+
+        return cast(_F, wrapper)
+
+    return decorator
 
 
 def _is_pydantic_model(cls: Any) -> bool:
@@ -56,13 +165,26 @@ def _is_pydantic_model(cls: Any) -> bool:
         return False
 
 
+@_memoize_hashable(maxsize=256)
 def _is_schema_class(cls: Any) -> bool:
-    """Return True if cls is a dataclass or Pydantic BaseModel."""
+    """
+    Return True if cls is a dataclass or Pydantic BaseModel.
+
+    Results are memoized per type, since conversion and validation ask this of
+    the same field and element types on every parse.
+    """
     return dataclasses.is_dataclass(cls) or _is_pydantic_model(cls)
 
 
-def _get_schema_fields(cls: Type[Any]) -> list[_SchemaField]:
-    """Return unified field descriptors for a dataclass or Pydantic model."""
+@functools.lru_cache(maxsize=64)
+def _get_schema_fields(cls: Type[Any]) -> tuple[_SchemaField, ...]:
+    """
+    Return unified field descriptors for a dataclass or Pydantic model.
+
+    The result is cached per class, so the field walk (and the metadata copy it
+    implies) is paid once per schema class rather than on every parser
+    construction and every call to `parse()`.
+    """
     if _is_pydantic_model(cls):
         fields: list[_SchemaField] = []
         for name, field_info in cls.model_fields.items():
@@ -78,6 +200,11 @@ def _get_schema_fields(cls: Type[Any]) -> list[_SchemaField]:
             metadata: dict[str, Any] = {}
             if field_info.description:
                 metadata["help"] = field_info.description
+            else:
+                # Pydantic keeps unrecognised Annotated markers in `metadata`
+                help_text = _find_help(field_info.metadata)
+                if help_text:
+                    metadata["help"] = help_text
             fields.append(
                 _SchemaField(
                     name=name,
@@ -85,30 +212,54 @@ def _get_schema_fields(cls: Type[Any]) -> list[_SchemaField]:
                     default=default,
                     default_factory=default_factory,
                     metadata=metadata,
+                    help=metadata.get("help", ""),
                 )
             )
-        return fields
-
-    return [
-        _SchemaField(
-            name=field.name,
-            type=field.type,
-            default=field.default,
-            default_factory=field.default_factory,
-            metadata=dict(field.metadata),
+        return tuple(fields)
+
+    dc_fields = dataclasses.fields(cls)
+    # With `from __future__ import annotations` field types are strings; resolve
+    # them once here so everything downstream sees real types.
+    hints: dict[str, Any] = {}
+    if any(isinstance(field.type, str) for field in dc_fields):
+        try:
+            hints = typing.get_type_hints(cls, include_extras=True)
+        except NameError:
+            # Leave unresolvable forward references as they are
+            pass
+
+    schema_fields = []
+    for field in dc_fields:
+        field_type, help_text = _split_annotated(hints.get(field.name, field.type))
+        schema_fields.append(
+            _SchemaField(
+                name=field.name,
+                type=field_type,
+                default=field.default,
+                default_factory=field.default_factory,
+                metadata=dict(field.metadata),
+                help=field.metadata.get("help", help_text),
+            )
         )
-        for field in dataclasses.fields(cls)
-    ]
+    return tuple(schema_fields)
+
 
+# Origins of union types: `Union[...]`/`Optional[...]`, plus `X | None` (PEP 604)
+# on Python 3.10+
+_UNION_ORIGINS: tuple[Any, ...] = (Union, getattr(types, "UnionType", Union))
 
+
+@_memoize_hashable(maxsize=256)
 def _get_optional_inner_type(type_hint: Any) -> Optional[Any]:
     """
     If type_hint is Optional[T] (i.e., Union[T, None]), return T.
     Otherwise, return None.
+
+    Results are memoized per type hint, since validation calls this for every
+    field on every parse.
     """
-    origin = getattr(type_hint, "__origin__", None)
-    if origin is Union:
-        args = type_hint.__args__
+    if typing.get_origin(type_hint) in _UNION_ORIGINS:
+        args = typing.get_args(type_hint)
         # Optional[T] is Union[T, None], so we check for exactly two args with one being NoneType
         non_none_args = [a for a in args if a is not type(None)]
         if len(non_none_args) == 1 and type(None) in args:
@@ -116,6 +267,103 @@ def _get_optional_inner_type(type_hint: Any) -> Optional[Any]:
     return None
 
 
+class _FieldPlan(NamedTuple):
+    """
+    Per-field build plan, computed once per argument prefix.
+
+    Holds everything `parse()` needs to resolve a field without re-inspecting
+    its type on every call.
+    """
+
+    field: _SchemaField
+    # interned "<prefix>.<name>" dest / option name
+    arg_key: str
+    # declared field type (`str` when the field has no annotation)
+    arg_type: Any
+    # schema class to merge nested overrides into (Optional stripped), or None
+    nested_type: Any
+    # whether `_handle_field_type` can change a value of this type
+    needs_conversion: bool
+    # whether argparse's converter fully checks command-line values
+    cli_validated: bool
+
+
+def _needs_conversion(arg_type: Any) -> bool:
+    """
+    Return True if `DataclassArgParser._handle_field_type` acts on `arg_type`.
+
+    That is the case for Optional[SchemaClass], tuples, and lists of a schema
+    class; values of any other type are passed through unchanged.
+    """
+    inner_type = _get_optional_inner_type(arg_type)
+    if inner_type is not None:
+        return _is_schema_class(inner_type)
+    origin = typing.get_origin(arg_type)
+    if origin is tuple:
+        return True
+    if origin is list:
+        args = typing.get_args(arg_type)
+        return len(args) == 1 and _is_schema_class(args[0])
+    return False
+
+
+def _is_cli_validated(arg_type: Any) -> bool:
+    """
+    Return True if the argparse converter for `arg_type` fully checks values.
+
+    That is the case for basic types, Literal, and lists, tuples and dicts
+    whose element, key and value types are all basic types. Command-line
+    values of other types (nested containers, custom classes) still go
+    through `DataclassArgParser._validate_type`.
+    """
+    arg_type = _get_optional_inner_type(arg_type) or arg_type
+    if _scalar_value_check(arg_type) is not None:
+        return True
+    origin = typing.get_origin(arg_type)
+    if origin is Literal:
+        return True
+    if origin in (list, tuple, dict):
+        args = typing.get_args(arg_type)
+        return bool(args) and all(_scalar_value_check(a) is not None for a in args)
+    return False
+
+
+@functools.lru_cache(maxsize=128)
+def _build_field_plans(cls: Type[Any], prefix: str) -> tuple[_FieldPlan, ...]:
+    """
+    Build the field plans for schema class `cls` registered under `prefix`.
+
+    Plans only depend on the class and the prefix, so they are cached and
+    shared by every parser built for the same class.
+    """
+    plans = []
+    for field in _get_schema_fields(cls):
+        arg_type = field.type if field.type is not dataclasses.MISSING else str
+        actual_type = _get_optional_inner_type(arg_type) or arg_type
+        plans.append(
+            _FieldPlan(
+                field=field,
+                arg_key=sys.intern(f"{prefix}.{field.name}"),
+                arg_type=arg_type,
+                nested_type=actual_type if _is_schema_class(actual_type) else None,
+                needs_conversion=_needs_conversion(arg_type),
+                cli_validated=_is_cli_validated(arg_type),
+            )
+        )
+    return tuple(plans)
+
+
+# Accepted spellings of boolean command-line values
+_BOOL_STRINGS: dict[str, bool] = {
+    "True": True,
+    "true": True,
+    "1": True,
+    "False": False,
+    "false": False,
+    "0": False,
+}
+
+
 def _strict_bool(value: str) -> bool:
     """
     Parse a string to a boolean value strictly.
@@ -123,14 +371,451 @@ def _strict_bool(value: str) -> bool:
     Only accepts 'True', 'true', 'False', 'false', '1', '0' as valid values.
     Raises argparse.ArgumentTypeError for any other string.
     """
-    if value in ("True", "true", "1"):
-        return True
-    elif value in ("False", "false", "0"):
-        return False
-    else:
+    try:
+        return _BOOL_STRINGS[value]
+    except KeyError:
         raise argparse.ArgumentTypeError(
             f"Invalid boolean value: '{value}'. Must be one of: True, true, False, false, 1, 0"
+        ) from None
+
+
+# Argparse `type=` converters and metavars for the basic field types, resolved
+# once at import instead of being rebuilt for every registered field.
+_TYPE_CONVERTERS: dict[Any, typing.Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    str: str,
+    bool: _strict_bool,
+}
+_TYPE_METAVARS: dict[Any, str] = {
+    int: "INT",
+    float: "FLOAT",
+    str: "STRING",
+    bool: "BOOL",
+}
+
+
+# Strict value checks for basic field types, used when validating config
+# file values and defaults. bool is excluded from int and float on purpose.
+# For int and float an exact-type test comes first, so plain builtins (almost
+# every loaded value) skip the bool exclusion; subclasses still go through the
+# isinstance checks.
+_SCALAR_VALUE_CHECKS: dict[Any, typing.Callable[[Any], bool]] = {
+    int: lambda v: type(v) is int or (isinstance(v, int) and not isinstance(v, bool)),
+    float: lambda v: (
+        type(v) is float
+        or (isinstance(v, (int, float)) and not isinstance(v, bool))
+    ),
+    bool: lambda v: type(v) is bool,  # bool cannot be subclassed
+    str: lambda v: isinstance(v, str),
+}
+
+
+_V = typing.TypeVar("_V")
+
+
+def _lookup_builtin(table: dict[Any, _V], typ: Any) -> Optional[_V]:
+    """
+    Look up a class in a table keyed by builtin types.
+
+    Returns None for anything that is not a class, so element annotations that
+    cannot be hashed (such as `Annotated[int, {...}]`) are simply not found.
+    """
+    return table.get(typ) if isinstance(typ, type) else None
+
+
+def _scalar_value_check(arg_type: Any) -> Optional[typing.Callable[[Any], bool]]:
+    """Return the strict value check for a basic type, or None for other types."""
+    return _lookup_builtin(_SCALAR_VALUE_CHECKS, arg_type)
+
+
+def _split_items(s: str) -> list[str]:
+    """Split a comma-separated command-line value into stripped, non-empty items."""
+    return [item for item in map(str.strip, s.split(",")) if item]
+
+
+# Direct parsers for the common spelling of int, float and bool elements
+_FAST_SCALAR_PARSERS: dict[Any, typing.Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    bool: _BOOL_STRINGS.__getitem__,
+}
+
+
+def _read_literal(text: str, fast_parse: typing.Callable[[str], Any]) -> Any:
+    """
+    Read a scalar command-line value, trying `fast_parse` before `ast.literal_eval`.
+
+    Text that is not a Python literal is returned unchanged.
+    """
+    try:
+        return fast_parse(text)
+    except (KeyError, ValueError):
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        # Not a literal, treat as string
+        return text
+
+
+def _element_converter(typ: Any) -> typing.Callable[[str], Any]:
+    """
+    Return the converter for one element of a tuple or list command-line value.
+
+    int, float and bool elements are parsed directly when the string is in
+    their plain form ("3", "2.5", "True"). Anything else is read with
+    `ast.literal_eval` before the type is applied, so values such as "1e3",
+    "1.5" for an int, or "0x10" are still accepted. Other element types are
+    called on the raw string.
+    """
+    fast_parse = _lookup_builtin(_FAST_SCALAR_PARSERS, typ)
+    if fast_parse is None:
+        return typ
+
+    def convert(item: str) -> Any:
+        try:
+            return fast_parse(item)
+        except (KeyError, ValueError):
+            return typ(ast.literal_eval(item))
+
+    return convert
+
+
+def _raise_item_error(
+    items: typing.Iterable[str],
+    converters: typing.Iterable[typing.Callable[[str], Any]],
+    expected_types: typing.Iterable[Any],
+) -> None:
+    """
+    Raise an ArgumentTypeError naming the first item that fails to convert.
+
+    Collection parsers convert all items in one pass and only call this after
+    that pass has failed, so the happy path does not track which item is
+    being converted.
+    """
+    for item, convert, typ in zip(items, converters, expected_types):
+        try:
+            convert(item)
+        except Exception:
+            raise argparse.ArgumentTypeError(
+                f"Could not convert '{item}' to {typ.__name__}"
+            )
+
+
+@_memoize_hashable(maxsize=128)
+def _tuple_type_factory(tuple_type: Any) -> typing.Callable[[str], tuple]:
+    """
+    Return a function that parses a string into a tuple of the correct type and length.
+
+    Args:
+        tuple_type: The typing.Tuple type to parse.
+
+    Returns:
+        Callable[[str], tuple]: A function that parses a string into a tuple.
+    """
+    expected_types = typing.get_args(tuple_type)
+    converters = tuple(_element_converter(typ) for typ in expected_types)
+
+    def parse_tuple(s):
+        try:
+            if s.startswith("(") and s.endswith(")"):
+                s = s[1:-1]
+            items = _split_items(s)
+            if len(items) != len(expected_types):
+                raise argparse.ArgumentTypeError(
+                    f"Expected {len(expected_types)} values, got {len(items)}"
+                )
+            try:
+                return tuple(
+                    convert(item) for convert, item in zip(converters, items)
+                )
+            except Exception:
+                _raise_item_error(items, converters, expected_types)
+                raise
+        except Exception as e:
+            raise argparse.ArgumentTypeError(f"Invalid tuple value: {s} ({e})")
+
+    return parse_tuple
+
+
+@_memoize_hashable(maxsize=128)
+def _list_type_factory(list_type: Any) -> typing.Callable[[str], list]:
+    """
+    Return a function that parses a string into a list of the correct type.
+
+    Args:
+        list_type: The typing.List type to parse.
+
+    Returns:
+        Callable[[str], list]: A function that parses a string into a list.
+    """
+    args = typing.get_args(list_type)
+    elem_type = args[0] if args else str
+    convert = _element_converter(elem_type)
+    fast_parse = _lookup_builtin(_FAST_SCALAR_PARSERS, elem_type)
+
+    def parse_list(s):
+        try:
+            if s.startswith("[") and s.endswith("]"):
+                s = s[1:-1]
+            items = _split_items(s)
+            if fast_parse is not None:
+                # Long int/float/bool lists in their plain spelling are
+                # converted by map() without a Python-level call per item
+                try:
+                    return list(map(fast_parse, items))
+                except (KeyError, ValueError):
+                    pass
+            try:
+                return [convert(item) for item in items]
+            except Exception:
+                _raise_item_error(
+                    items, itertools.repeat(convert), itertools.repeat(elem_type)
+                )
+                raise
+        except Exception as e:
+            raise argparse.ArgumentTypeError(f"Invalid list value: {s} ({e})")
+
+    return parse_list
+
+
+def _json_value_validator(typ: type) -> typing.Callable[[Any], Any]:
+    """
+    Return the strict validator for decoded JSON dict values of basic type `typ`.
+
+    The strictness rules are those of `_SCALAR_VALUE_CHECKS`; int values are
+    widened to float for float dicts.
+    """
+    check = _SCALAR_VALUE_CHECKS[typ]
+
+    def validate(v: Any) -> Any:
+        if not check(v):
+            raise argparse.ArgumentTypeError(
+                f"Expected {typ.__name__} for value, got {type(v).__name__}: {v!r}"
+            )
+        return float(v) if typ is float else v
+
+    return validate
+
+
+def _read_int_value(value: str) -> int:
+    """Read a key=value dict value as a strict int."""
+    parsed_value = _read_literal(value, int)
+    if not _SCALAR_VALUE_CHECKS[int](parsed_value):
+        raise argparse.ArgumentTypeError(
+            f"Expected int for value, got {type(parsed_value).__name__}: {value!r}"
+        )
+    return parsed_value
+
+
+def _read_float_value(value: str) -> float:
+    """Read a key=value dict value as a strict float (ints are widened)."""
+    parsed_value = _read_literal(value, float)
+    if not _SCALAR_VALUE_CHECKS[float](parsed_value):
+        raise argparse.ArgumentTypeError(
+            f"Expected float for value, got {type(parsed_value).__name__}: {value!r}"
+        )
+    return float(parsed_value)
+
+
+def _read_bool_value(value: str) -> bool:
+    """Read a key=value dict value as a strict bool."""
+    parsed_value = _read_literal(value, _BOOL_STRINGS.__getitem__)
+    if not _SCALAR_VALUE_CHECKS[bool](parsed_value):
+        raise argparse.ArgumentTypeError(f"Expected bool for value, got: {value!r}")
+    return parsed_value
+
+
+def _coerce_dict_value(value_type: Any) -> typing.Callable[[Any], Any]:
+    """
+    Return a converter that calls `value_type` on a dict value.
+
+    Used for value types without a strict check in the tables below; failures
+    are reported as `argparse.ArgumentTypeError`.
+    """
+
+    def coerce(v: Any) -> Any:
+        try:
+            return value_type(v)
+        except Exception:
+            raise argparse.ArgumentTypeError(
+                f"Could not convert value '{v}' to {value_type.__name__}"
+            )
+
+    return coerce
+
+
+# Strict value checks for dict arguments, keyed by the annotated value type.
+# JSON input is validated as decoded; key=value input is read from text (only
+# int, float and bool values are read as literals, str values are kept as-is).
+# Other value types are converted by calling the type.
+_JSON_DICT_VALUE_VALIDATORS: dict[Any, typing.Callable[[Any], Any]] = {
+    typ: _json_value_validator(typ) for typ in (int, float, bool, str)
+}
+_TEXT_DICT_VALUE_CONVERTERS: dict[Any, typing.Callable[[str], Any]] = {
+    int: _read_int_value,
+    float: _read_float_value,
+    bool: _read_bool_value,
+    str: str,
+}
+
+
+@_memoize_hashable(maxsize=128)
+def _dict_type_factory(dict_type: Any) -> typing.Callable[[str], dict]:
+    """
+    Return a function that parses a string into a dict of the correct type.
+
+    Args:
+        dict_type: The typing.Dict type to parse.
+
+    Returns:
+        Callable[[str], dict]: A function that parses a string into a dict.
+    """
+    # Resolve the expected key and value types once per argument
+    args = typing.get_args(dict_type)
+    key_type = args[0] if len(args) >= 1 else str  # Default to str
+    value_type = args[1] if len(args) >= 2 else str  # Default to str
+    validate_json_value = _lookup_builtin(
+        _JSON_DICT_VALUE_VALIDATORS, value_type
+    ) or _coerce_dict_value(value_type)
+    convert_text_value = _lookup_builtin(
+        _TEXT_DICT_VALUE_CONVERTERS, value_type
+    ) or _coerce_dict_value(value_type)
+
+    def parse_dict(s):
+        try:
+            # Handle empty string as empty dict
+            stripped = s.strip()
+            if not stripped:
+                return {}
+
+            # Try JSON format first
+            if stripped.startswith("{") and stripped.endswith("}"):
+                try:
+                    result = _json_loads(s)
+                    if not isinstance(result, dict):
+                        raise argparse.ArgumentTypeError(
+                            f"JSON value must be an object/dict, got {type(result).__name__}"
+                        )
+
+                    # Convert keys and values to the expected types
+                    typed_result = {}
+                    for k, v in result.items():
+                        # Convert key
+                        try:
+                            if key_type is not str:
+                                k = key_type(k)
+                        except Exception:
+                            raise argparse.ArgumentTypeError(
+                                f"Could not convert key '{k}' to {key_type.__name__}"
+                            )
+
+                        # Strict type validation for value
+                        typed_result[k] = validate_json_value(v)
+
+                    return typed_result
+                except json.JSONDecodeError as e:
+                    raise argparse.ArgumentTypeError(f"Invalid JSON format: {e}")
+
+            # Try key=value,key2=value2 format
+            else:
+                result = {}
+                pairs = _split_items(s)
+                for pair in pairs:
+                    if "=" not in pair:
+                        raise argparse.ArgumentTypeError(
+                            f"Invalid key=value format: '{pair}' (missing '=')"
+                        )
+
+                    key, value = pair.split("=", 1)  # Split only on first =
+                    key = key.strip()
+                    value = value.strip()
+
+                    # Convert key
+                    try:
+                        if key_type is not str:
+                            key = key_type(key)
+                    except Exception:
+                        raise argparse.ArgumentTypeError(
+                            f"Could not convert key '{key}' to {key_type.__name__}"
+                        )
+
+                    # Convert value with strict type checking
+                    result[key] = convert_text_value(value)
+
+                return result
+
+        except Exception as e:
+            if isinstance(e, argparse.ArgumentTypeError):
+                raise
+            raise argparse.ArgumentTypeError(f"Invalid dict value: {s} ({e})")
+
+    return parse_dict
+
+
+# Argument type factory and metavar for each supported generic container
+# origin (`typing.Tuple[...]` etc. report the builtin as their origin). The
+# factories are cached per type, so equal annotations share one parser.
+_GENERIC_TYPE_FACTORIES: dict[Any, tuple[typing.Callable[[Any], Any], str]] = {
+    tuple: (_tuple_type_factory, "TUPLE"),
+    list: (_list_type_factory, "LIST"),
+    dict: (_dict_type_factory, "DICT"),
+}
+
+
+def _load_yaml_config(f: typing.TextIO) -> Any:
+    """Load a YAML config file, raising ValueError if it is invalid."""
+    yaml = _get_yaml()
+    if yaml is None:
+        raise ValueError(
+            "YAML support not available. Please install PyYAML: pip install PyYAML"
         )
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(f, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML file: {e}")
+
+
+def _load_json_config(f: typing.TextIO) -> Any:
+    """Load a JSON config file, raising ValueError if it is invalid."""
+    try:
+        return _json_loads(f.read())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON file: {e}")
+
+
+# Config file loaders keyed by lower-cased file extension.
+_CONFIG_LOADERS: dict[str, typing.Callable[[typing.TextIO], Any]] = {
+    ".yaml": _load_yaml_config,
+    ".yml": _load_yaml_config,
+    ".json": _load_json_config,
+}
+
+
+def _normalize_flag_spec(item: Any) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Normalize a `flags=` entry to `(option_strings, add_argument_kwargs)`.
+
+    Accepts either a `(names, kwargs)` pair or a `{'names': ..., 'kwargs': ...}`
+    dict, where `names` is a single option string or a sequence of them.
+    """
+    if isinstance(item, dict) and "names" in item:
+        names = item["names"]
+        kwargs = item.get("kwargs")
+    elif isinstance(item, (list, tuple)) and len(item) == 2:
+        names, kwargs = item
+    else:
+        raise ValueError(
+            "Each flag must be (names, kwargs) tuple or {'names': ..., 'kwargs': ...} dict"
+        )
+
+    # Normalize single name to tuple for add_argument
+    if isinstance(names, str):
+        return (names,), kwargs or {}
+    return tuple(names), kwargs or {}
 
 
 class DataclassArgParser:
@@ -140,8 +825,9 @@ class DataclassArgParser:
 
     This class takes one or more dataclass or Pydantic model types and creates
     an argparse.ArgumentParser with arguments corresponding to each field.
-    Help text is extracted from the 'help' key in dataclass field metadata or
-    from Pydantic Field descriptions, and metavars are generated based on field types.
+    Help text is extracted from the 'help' key in dataclass field metadata, from a
+    `Help` marker in an `Annotated` field type, or from Pydantic Field descriptions,
+    and metavars are generated based on field types.
 
     For Pydantic models, field validation is delegated to Pydantic's model_validate()
     instead of the built-in manual type validation.
@@ -168,6 +854,16 @@ class DataclassArgParser:
         # python script.py --config config.yaml
     """
 
+    __slots__ = (
+        "dataclass_types",
+        "parser",
+        "_requested_config_flag",
+        "_config_dest",
+        "_field_dests",
+        "_plans",
+        "_nested_children",
+    )
+
     def __init__(
         self,
         *dataclass_types: Type[Any],
@@ -195,6 +891,14 @@ class DataclassArgParser:
         self._requested_config_flag = config_flag
         # actual dest name for the config argument (populated when added)
         self._config_dest: str = "config"
+        # interned dest name -> (argument prefix, field name) for every
+        # generated schema-field argument, filled in at registration time
+        self._field_dests: dict[str, tuple[str, str]] = {}
+        # argument prefix -> field plans for the schema class registered there
+        self._plans: dict[str, tuple[_FieldPlan, ...]] = {}
+        # argument prefix -> every prefix at or below it that owns at least one
+        # generated argument; used to detect nested overrides without scanning
+        self._nested_children: dict[str, tuple[str, ...]] = {}
         self._add_config_argument(self._requested_config_flag)
 
         # Add any individual flags provided by the caller before dataclass args
@@ -203,21 +907,8 @@ class DataclassArgParser:
         # - {'names': name_or_list, 'kwargs': {...}}
         if flags:
             for item in flags:
-                if isinstance(item, dict) and "names" in item:
-                    names = item["names"]
-                    kwargs = item.get("kwargs", {})
-                elif isinstance(item, (list, tuple)) and len(item) == 2:
-                    names, kwargs = item
-                else:
-                    raise ValueError(
-                        "Each flag must be (names, kwargs) tuple or {'names': ..., 'kwargs': ...} dict"
-                    )
-
-                # Normalize single name to tuple for add_argument
-                if isinstance(names, str):
-                    names = (names,)
-
-                self.add_flag(*names, **(kwargs or {}))
+                names, kwargs = _normalize_flag_spec(item)
+                self.add_flag(*names, **kwargs)
 
         self._add_dataclass_arguments()
 
@@ -232,15 +923,16 @@ class DataclassArgParser:
             *names: One or more option strings (e.g. '--foo' or '-f', '--foo').
             **kwargs: Keyword arguments passed through to argparse.ArgumentParser.add_argument.
         """
-        # Check for name conflicts with existing option strings
-        for n in names:
-            if n in self.parser._option_string_actions:
-                raise ValueError(f"Flag name conflict: {n}")
-
         # Simply forward to the underlying argparse parser. This provides a
         # convenient way to mix manually-declared flags with auto-generated
-        # dataclass arguments.
-        self.parser.add_argument(*names, **kwargs)
+        # dataclass arguments. argparse rejects option strings that are
+        # already registered (however they were added).
+        try:
+            self.parser.add_argument(*names, **kwargs)
+        except argparse.ArgumentError as e:
+            # e.g. "conflicting option string: --foo"
+            conflicts = e.message.rpartition(": ")[2]
+            raise ValueError(f"Flag name conflict: {conflicts}") from e
 
     def _add_config_argument(
         self, config_flag: Union[str, list[str], tuple[str, ...]] = "--config"
@@ -262,7 +954,7 @@ class DataclassArgParser:
         else:
             names = tuple(config_flag)
 
-        self.parser.add_argument(
+        action = self.parser.add_argument(
             *names,
             type=str,
             metavar="FILE",
@@ -270,9 +962,7 @@ class DataclassArgParser:
         )
 
         # Record the dest name created by argparse for the config argument.
-        # The most-recently-added action corresponds to this argument.
-        if self.parser._actions:
-            self._config_dest = self.parser._actions[-1].dest
+        self._config_dest = action.dest
 
     def _load_config_file(self, config_path: str) -> dict[str, Any]:
         """
@@ -291,291 +981,22 @@ class DataclassArgParser:
             FileNotFoundError: If the config file doesn't exist.
             ValueError: If the file format is not supported or invalid.
         """
-        if not os.path.exists(config_path):
+        # A single open() both checks existence and gets the handle, instead of
+        # stat-ing the path first with os.path.exists.
+        try:
+            f = open(config_path, "r")
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        file_ext = os.path.splitext(config_path)[1].lower()
-
-        with open(config_path, "r") as f:
-            if file_ext in [".yaml", ".yml"]:
-                if not HAS_YAML:
-                    raise ValueError(
-                        "YAML support not available. Please install PyYAML: pip install PyYAML"
-                    )
-                try:
-                    return yaml.safe_load(f)
-                except yaml.YAMLError as e:
-                    raise ValueError(f"Invalid YAML file: {e}")
-            elif file_ext == ".json":
-                try:
-                    return json.load(f)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON file: {e}")
-            else:
+        with f:
+            file_ext = os.path.splitext(config_path)[1].lower()
+            loader = _CONFIG_LOADERS.get(file_ext)
+            if loader is None:
                 raise ValueError(
                     f"Unsupported file format: {file_ext}. "
                     "Supported formats are: .yaml, .yml, .json"
                 )
-
-    def _tuple_type_factory(self, tuple_type: Any) -> typing.Callable[[str], tuple]:
-        """
-        Return a function that parses a string into a tuple of the correct type and length.
-        """
-        """
-        Return a function that parses a string into a tuple of the correct type and length.
-
-        Args:
-            tuple_type: The typing.Tuple type to parse.
-
-        Returns:
-            Callable[[str], tuple]: A function that parses a string into a tuple.
-        """
-
-        def parse_tuple(s):
-            try:
-                if s.startswith("(") and s.endswith(")"):
-                    s = s[1:-1]
-                items = [item.strip() for item in s.split(",") if item.strip()]
-                expected_types = tuple_type.__args__
-                if len(items) != len(expected_types):
-                    raise argparse.ArgumentTypeError(
-                        f"Expected {len(expected_types)} values, got {len(items)}"
-                    )
-                result = []
-                for item, typ in zip(items, expected_types):
-                    try:
-                        value = (
-                            ast.literal_eval(item)
-                            if typ in (int, float, bool)
-                            else item
-                        )
-                        value = typ(value)
-                    except Exception:
-                        raise argparse.ArgumentTypeError(
-                            f"Could not convert '{item}' to {typ.__name__}"
-                        )
-                    result.append(value)
-                return tuple(result)
-            except Exception as e:
-                raise argparse.ArgumentTypeError(f"Invalid tuple value: {s} ({e})")
-
-        return parse_tuple
-
-    def _list_type_factory(self, list_type: Any) -> typing.Callable[[str], list]:
-        """
-        Return a function that parses a string into a list of the correct type.
-        """
-        """
-        Return a function that parses a string into a list of the correct type.
-
-        Args:
-            list_type: The typing.List type to parse.
-
-        Returns:
-            Callable[[str], list]: A function that parses a string into a list.
-        """
-
-        def parse_list(s):
-            try:
-                if s.startswith("[") and s.endswith("]"):
-                    s = s[1:-1]
-                items = [item.strip() for item in s.split(",") if item.strip()]
-                elem_type = (
-                    list_type.__args__[0]
-                    if hasattr(list_type, "__args__") and list_type.__args__
-                    else str
-                )
-                result = []
-                for item in items:
-                    try:
-                        value = (
-                            ast.literal_eval(item)
-                            if elem_type in (int, float, bool)
-                            else item
-                        )
-                        value = elem_type(value)
-                    except Exception:
-                        raise argparse.ArgumentTypeError(
-                            f"Could not convert '{item}' to {elem_type.__name__}"
-                        )
-                    result.append(value)
-                return result
-            except Exception as e:
-                raise argparse.ArgumentTypeError(f"Invalid list value: {s} ({e})")
-
-        return parse_list
-
-    def _dict_type_factory(self, dict_type: Any) -> typing.Callable[[str], dict]:
-        """
-        Return a function that parses a string into a dict of the correct type.
-
-        Args:
-            dict_type: The typing.Dict type to parse.
-
-        Returns:
-            Callable[[str], dict]: A function that parses a string into a dict.
-        """
-
-        def parse_dict(s):
-            try:
-                # Handle empty string as empty dict
-                if not s.strip():
-                    return {}
-
-                # Try JSON format first
-                if s.strip().startswith("{") and s.strip().endswith("}"):
-                    try:
-                        result = json.loads(s)
-                        if not isinstance(result, dict):
-                            raise argparse.ArgumentTypeError(
-                                f"JSON value must be an object/dict, got {type(result).__name__}"
-                            )
-
-                        # Get the expected key and value types
-                        key_type = str  # Default to str
-                        value_type = str  # Default to str
-                        if hasattr(dict_type, "__args__") and dict_type.__args__:
-                            if len(dict_type.__args__) >= 1:
-                                key_type = dict_type.__args__[0]
-                            if len(dict_type.__args__) >= 2:
-                                value_type = dict_type.__args__[1]
-
-                        # Convert keys and values to the expected types
-                        typed_result = {}
-                        for k, v in result.items():
-                            # Convert key
-                            try:
-                                if key_type is not str:
-                                    k = key_type(k)
-                            except Exception:
-                                raise argparse.ArgumentTypeError(
-                                    f"Could not convert key '{k}' to {key_type.__name__}"
-                                )
-
-                            # Strict type validation for value
-                            if value_type is int:
-                                if not isinstance(v, int) or isinstance(v, bool):
-                                    raise argparse.ArgumentTypeError(
-                                        f"Expected int for value, got {type(v).__name__}: {v!r}"
-                                    )
-                            elif value_type is float:
-                                if not isinstance(v, (int, float)) or isinstance(
-                                    v, bool
-                                ):
-                                    raise argparse.ArgumentTypeError(
-                                        f"Expected float for value, got {type(v).__name__}: {v!r}"
-                                    )
-                                v = float(v)
-                            elif value_type is bool:
-                                if not isinstance(v, bool):
-                                    raise argparse.ArgumentTypeError(
-                                        f"Expected bool for value, got {type(v).__name__}: {v!r}"
-                                    )
-                            elif value_type is str:
-                                if not isinstance(v, str):
-                                    raise argparse.ArgumentTypeError(
-                                        f"Expected str for value, got {type(v).__name__}: {v!r}"
-                                    )
-                            else:
-                                try:
-                                    v = value_type(v)
-                                except Exception:
-                                    raise argparse.ArgumentTypeError(
-                                        f"Could not convert value '{v}' to {value_type.__name__}"
-                                    )
-
-                            typed_result[k] = v
-
-                        return typed_result
-                    except json.JSONDecodeError as e:
-                        raise argparse.ArgumentTypeError(f"Invalid JSON format: {e}")
-
-                # Try key=value,key2=value2 format
-                else:
-                    result = {}
-                    # Get the expected key and value types
-                    key_type = str  # Default to str
-                    value_type = str  # Default to str
-                    if hasattr(dict_type, "__args__") and dict_type.__args__:
-                        if len(dict_type.__args__) >= 1:
-                            key_type = dict_type.__args__[0]
-                        if len(dict_type.__args__) >= 2:
-                            value_type = dict_type.__args__[1]
-
-                    pairs = [pair.strip() for pair in s.split(",") if pair.strip()]
-                    for pair in pairs:
-                        if "=" not in pair:
-                            raise argparse.ArgumentTypeError(
-                                f"Invalid key=value format: '{pair}' (missing '=')"
-                            )
-
-                        key, value = pair.split("=", 1)  # Split only on first =
-                        key = key.strip()
-                        value = value.strip()
-
-                        # Convert key
-                        try:
-                            if key_type is not str:
-                                key = key_type(key)
-                        except Exception:
-                            raise argparse.ArgumentTypeError(
-                                f"Could not convert key '{key}' to {key_type.__name__}"
-                            )
-
-                        # Convert value with strict type checking
-                        try:
-                            parsed_value = ast.literal_eval(value)
-                        except (ValueError, SyntaxError):
-                            # Not a literal, treat as string
-                            parsed_value = value
-
-                        if value_type is int:
-                            if not isinstance(parsed_value, int) or isinstance(
-                                parsed_value, bool
-                            ):
-                                raise argparse.ArgumentTypeError(
-                                    f"Expected int for value, got {type(parsed_value).__name__}: {value!r}"
-                                )
-                            value = parsed_value
-                        elif value_type is float:
-                            if not isinstance(parsed_value, (int, float)) or isinstance(
-                                parsed_value, bool
-                            ):
-                                raise argparse.ArgumentTypeError(
-                                    f"Expected float for value, got {type(parsed_value).__name__}: {value!r}"
-                                )
-                            value = float(parsed_value)
-                        elif value_type is bool:
-                            if isinstance(parsed_value, bool):
-                                value = parsed_value
-                            elif value in ("True", "true", "1"):
-                                value = True
-                            elif value in ("False", "false", "0"):
-                                value = False
-                            else:
-                                raise argparse.ArgumentTypeError(
-                                    f"Expected bool for value, got: {value!r}"
-                                )
-                        elif value_type is str:
-                            value = value  # Keep as string
-                        else:
-                            try:
-                                value = value_type(value)
-                            except Exception:
-                                raise argparse.ArgumentTypeError(
-                                    f"Could not convert value '{value}' to {value_type.__name__}"
-                                )
-
-                        result[key] = value
-
-                    return result
-
-            except Exception as e:
-                if isinstance(e, argparse.ArgumentTypeError):
-                    raise
-                raise argparse.ArgumentTypeError(f"Invalid dict value: {s} ({e})")
-
-        return parse_dict
+            return loader(f)
 
     def _get_field_default(self, field: _SchemaField) -> Any:
         """Extract the default value from a schema field."""
@@ -599,15 +1020,9 @@ class DataclassArgParser:
         Returns:
             Tuple of (metavar, parser_type) for the given type.
         """
-        basic_types = {
-            int: ("INT", int),
-            float: ("FLOAT", float),
-            str: ("STRING", str),
-            bool: ("BOOL", _strict_bool),
-        }
-
-        if arg_type in basic_types:
-            return basic_types[arg_type]
+        converter = _TYPE_CONVERTERS.get(arg_type)
+        if converter is not None:
+            return _TYPE_METAVARS[arg_type], converter
 
         # Fallback for unknown types
         if hasattr(arg_type, "__name__"):
@@ -624,6 +1039,15 @@ class DataclassArgParser:
         for cls in self.dataclass_types:
             self._add_fields_for_class(cls)
 
+        children: dict[str, dict[str, None]] = {}
+        for prefix, _ in self._field_dests.values():
+            parts = prefix.split(".")
+            for i in range(1, len(parts) + 1):
+                children.setdefault(".".join(parts[:i]), {})[prefix] = None
+        self._nested_children = {
+            key: tuple(prefixes) for key, prefixes in children.items()
+        }
+
     def _add_fields_for_class(
         self, cls: Type[Any], prefix: Optional[str] = None
     ) -> None:
@@ -636,36 +1060,45 @@ class DataclassArgParser:
         """
         prefix = prefix or cls.__name__
 
-        for field in _get_schema_fields(cls):
-            self._add_field_argument(field, prefix)
+        for plan in self._get_plans(cls, prefix):
+            self._add_field_argument(plan, prefix)
 
-    def _add_field_argument(self, field: _SchemaField, prefix: str) -> None:
+    def _get_plans(self, cls: Type[Any], prefix: str) -> tuple[_FieldPlan, ...]:
+        """Return the field plans for `cls` under `prefix`, building them on first use."""
+        plans = self._plans.get(prefix)
+        if plans is None:
+            plans = self._plans[prefix] = _build_field_plans(cls, prefix)
+        return plans
+
+    def _add_field_argument(self, plan: _FieldPlan, prefix: str) -> None:
         """
         Add a CLI argument for a single schema field.
 
         Args:
-            field: The schema field to process.
+            plan: The field plan of the schema field to process.
             prefix: The argument prefix for this field.
         """
-        arg_name = f"--{prefix}.{field.name}"
-        arg_type = field.type if field.type is not dataclasses.MISSING else str
+        field = plan.field
+        arg_key = plan.arg_key
+        arg_name = f"--{arg_key}"
+        arg_type = plan.arg_type
 
         # Handle Optional[T] by extracting the inner type
         inner_type = _get_optional_inner_type(arg_type)
         if inner_type is not None:
             arg_type = inner_type
 
+        # Handle nested schema class (recurse). Only a plain default can be a
+        # class object, so default factories are not run for nested fields;
+        # their description is never shown either.
+        if self._is_nested_schema_class(arg_type, field.default):
+            self._add_fields_for_class(cast(Type[Any], arg_type), prefix=arg_key)
+            return
+
         default_value = self._get_field_default(field)
-        description = self._format_description(
-            field.metadata.get("help", ""), default_value
-        )
+        description = self._format_description(field.help, default_value)
 
-        # Handle nested schema class (recurse)
-        if self._is_nested_schema_class(arg_type, default_value):
-            self._add_fields_for_class(
-                cast(Type[Any], arg_type), prefix=f"{prefix}.{field.name}"
-            )
-            return
+        self._field_dests[arg_key] = (prefix, field.name)
 
         # Handle generic types (Literal, Tuple, List, Dict)
         if self._try_add_generic_type_argument(arg_name, arg_type, description):
@@ -697,11 +1130,11 @@ class DataclassArgParser:
         Returns:
             True if the type was handled, False otherwise.
         """
-        type_origin = getattr(arg_type, "__origin__", None)
+        type_origin = typing.get_origin(arg_type)
 
         # Literal type
         if type_origin is Literal:
-            choices = getattr(arg_type, "__args__", ())
+            choices = typing.get_args(arg_type)
             metavar = "{" + ",".join(str(choice) for choice in choices) + "}"
             self.parser.add_argument(
                 arg_name,
@@ -712,37 +1145,18 @@ class DataclassArgParser:
             )
             return True
 
-        # Tuple type
-        if type_origin in (tuple, typing.Tuple):
-            self.parser.add_argument(
-                arg_name,
-                type=self._tuple_type_factory(arg_type),
-                help=description,
-                metavar="TUPLE",
-            )
-            return True
-
-        # List type
-        if type_origin in (list, typing.List):
-            self.parser.add_argument(
-                arg_name,
-                type=self._list_type_factory(arg_type),
-                help=description,
-                metavar="LIST",
-            )
-            return True
-
-        # Dict type
-        if type_origin in (dict, typing.Dict):
-            self.parser.add_argument(
-                arg_name,
-                type=self._dict_type_factory(arg_type),
-                help=description,
-                metavar="DICT",
-            )
-            return True
-
-        return False
+        # Tuple, List and Dict types
+        generic = _GENERIC_TYPE_FACTORIES.get(type_origin)
+        if generic is None:
+            return False
+        type_factory, metavar = generic
+        self.parser.add_argument(
+            arg_name,
+            type=type_factory(arg_type),
+            help=description,
+            metavar=metavar,
+        )
+        return True
 
     def parse(self, args: Optional[list[str]] = None) -> dict[str, Any]:
         """
@@ -758,6 +1172,48 @@ class DataclassArgParser:
             SystemExit: If required fields (those without defaults) are not provided either as command-line arguments or in the config file.
         """
 
+        instances, custom_flags = self._parse_instances(args)
+
+        result = {}
+        # Add dataclass instances
+        for cls, instance in zip(self.dataclass_types, instances):
+            result[cls.__name__] = instance
+
+        result.update(custom_flags)
+        return result
+
+    def parse_into(self, args: Optional[list[str]] = None) -> tuple[Any, ...]:
+        """
+        Parse command-line arguments and return only the dataclass instances.
+
+        This is a lighter alternative to `parse` for callers that unpack the
+        configuration objects directly; no result dict keyed by class name is
+        built, and custom flags are not returned.
+
+        Example:
+            sim_config, proc_config = parser.parse_into()
+
+        Args:
+            args (Optional[list[str]]): Optional list of arguments to parse. If None, uses sys.argv.
+
+        Returns:
+            tuple[Any, ...]: The instantiated objects, in the order their classes were
+            passed to the constructor.
+
+        Raises:
+            SystemExit: If required fields (those without defaults) are not provided either as command-line arguments or in the config file.
+        """
+        return self._parse_instances(args)[0]
+
+    def _parse_instances(
+        self, args: Optional[list[str]]
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """
+        Run argparse and build one instance per schema class.
+
+        Returns:
+            The instances (in constructor order) and the values of custom flags.
+        """
         parsed_args = vars(self.parser.parse_args(args))
 
         # Check if config file is provided (use recorded dest name to support custom flag)
@@ -765,21 +1221,26 @@ class DataclassArgParser:
         if parsed_args.get(self._config_dest):
             config_data = self._load_config_file(parsed_args[self._config_dest])
 
-        result = {}
-        # Add dataclass instances
-        dataclass_field_names = set()
-        for cls in self.dataclass_types:
-            instance = self._build_instance(cls, parsed_args, config_data)
-            result[cls.__name__] = instance
-            # Collect all schema argument keys
-            for field in _get_schema_fields(cls):
-                dataclass_field_names.add(f"{cls.__name__}.{field.name}")
-
-        # Add custom flags (not associated with dataclass fields)
+        # Dispatch the flat namespace in a single pass: values for generated
+        # field arguments are bucketed by argument prefix, anything else is a
+        # custom flag (not associated with dataclass fields).
+        cli_values: dict[str, dict[str, Any]] = {}
+        custom_flags = {}
+        field_dests = self._field_dests
         for key, value in parsed_args.items():
-            if key not in dataclass_field_names and key != self._config_dest:
-                result[key] = value
-        return result
+            owner = field_dests.get(key)
+            if owner is not None:
+                if value is not None:
+                    prefix, field_name = owner
+                    cli_values.setdefault(prefix, {})[field_name] = value
+            elif key != self._config_dest:
+                custom_flags[key] = value
+
+        instances = tuple(
+            self._build_instance(cls, cli_values, config_data)
+            for cls in self.dataclass_types
+        )
+        return instances, custom_flags
 
     # TODO: Add tests for safe_parse
     def safe_parse(
@@ -804,7 +1265,7 @@ class DataclassArgParser:
     def _build_instance(
         self,
         cls: Type[Any],
-        parsed_args: dict[str, Any],
+        cli_values: dict[str, dict[str, Any]],
         config_data: dict[str, Any],
         prefix: Optional[str] = None,
         config_section: Optional[dict[str, Any]] = None,
@@ -812,31 +1273,33 @@ class DataclassArgParser:
         """
         Build an instance of the dataclass `cls` using parsed arguments and config data.
         Handles required fields and nested dataclasses.
+
+        `cli_values` maps each argument prefix to the command-line values given
+        for the fields under that prefix (see `parse`).
         """
         prefix = prefix or cls.__name__
         config_section = config_section or config_data.get(cls.__name__, {})
+        cli_section = cli_values.get(prefix, {})
         values = {}
         missing_fields = []
         is_pydantic = _is_pydantic_model(cls)
-        for field in _get_schema_fields(cls):
-            field_name = field.name
-            arg_key = f"{prefix}.{field_name}"
-            arg_type = field.type if field.type is not dataclasses.MISSING else str
-
-            value = self._resolve_field_value(
-                field, arg_key, arg_type, config_section, parsed_args, config_data
+        for plan in self._get_plans(cls, prefix):
+            value, from_cli = self._resolve_field_value(
+                plan, config_section, cli_section, cli_values, config_data
             )
 
             # Type-specific handling (dataclasses only; Pydantic validates at instantiation)
             if not is_pydantic:
-                value = self._handle_field_type(value, arg_type)
-                # Validate type (for config file values; CLI values are validated by argparse)
-                self._validate_type(value, arg_type, f"{prefix}.{field_name}")
+                if plan.needs_conversion:
+                    value = self._handle_field_type(value, plan.arg_type)
+                # Validate type (unless argparse already fully checked the CLI value)
+                if not (from_cli and plan.cli_validated):
+                    self._validate_type(value, plan.arg_type, plan.arg_key)
 
             if value is dataclasses.MISSING:
-                missing_fields.append(f"--{arg_key}")
+                missing_fields.append(f"--{plan.arg_key}")
             else:
-                values[field_name] = value
+                values[plan.field.name] = value
 
         if missing_fields:
             error_msg = (
@@ -850,16 +1313,20 @@ class DataclassArgParser:
 
     def _resolve_field_value(
         self,
-        field: _SchemaField,
-        arg_key: str,
-        arg_type: Any,
+        plan: _FieldPlan,
         config_section: dict[str, Any],
-        parsed_args: dict[str, Any],
+        cli_section: dict[str, Any],
+        cli_values: dict[str, dict[str, Any]],
         config_data: dict[str, Any],
-    ) -> Any:
+    ) -> tuple[Any, bool]:
         """
         Resolve the value for a dataclass field from defaults, config, CLI, and nested overrides.
+
+        Returns:
+            The value and whether it was taken as-is from the command line.
         """
+        field = plan.field
+        from_cli = False
         # 1. Default
         if field.default is not dataclasses.MISSING:
             value = field.default
@@ -873,44 +1340,30 @@ class DataclassArgParser:
             value = config_section[field.name]
 
         # 3. Command-line
-        if arg_key in parsed_args and parsed_args[arg_key] is not None:
-            value = parsed_args[arg_key]
+        if field.name in cli_section:
+            value = cli_section[field.name]
+            from_cli = True
 
-        # 4. Nested dataclass: check for overrides
-        # Handle Optional[DataClass] by extracting the inner type
-        actual_type = arg_type
-        inner_type = _get_optional_inner_type(arg_type)
-        if inner_type is not None:
-            actual_type = inner_type
-
-        if _is_schema_class(actual_type):
+        # 4. Nested dataclass (Optional stripped at plan time): check for overrides
+        if plan.nested_type is not None:
+            arg_key = plan.arg_key
             nested_config = (
                 config_section.get(field.name, {})
                 if isinstance(config_section, dict)
                 else {}
             )
-            nested_prefix = f"{arg_key}."
             has_override = any(
-                key.startswith(nested_prefix) and parsed_args[key] is not None
-                for key in parsed_args
+                key in cli_values for key in self._nested_children.get(arg_key, ())
             )
-
-            def config_has_override(cfg):
-                if isinstance(cfg, dict):
-                    if cfg:
-                        return True
-                    for v in cfg.values():
-                        if config_has_override(v):
-                            return True
-                return False
-
+            # A non-empty config mapping for the nested field is an override
             if not has_override:
-                has_override = config_has_override(nested_config)
+                has_override = isinstance(nested_config, dict) and bool(nested_config)
             if has_override:
                 value = self._merge_nested(
-                    actual_type, arg_key, nested_config, parsed_args, config_data
+                    plan.nested_type, arg_key, nested_config, cli_values, config_data
                 )
-        return value
+                from_cli = False
+        return value, from_cli
 
     def _handle_field_type(self, value: Any, arg_type: Any) -> Any:
         """
@@ -922,7 +1375,8 @@ class DataclassArgParser:
         if value is None:
             return value
 
-        origin = getattr(arg_type, "__origin__", None)
+        origin = typing.get_origin(arg_type)
+        args = typing.get_args(arg_type)
 
         # Handle Optional[SchemaClass] - convert dict to instance
         inner_type = _get_optional_inner_type(arg_type)
@@ -941,8 +1395,8 @@ class DataclassArgParser:
 
         # Handle tuple types (including tuples of dataclasses)
         # YAML/JSON files represent tuples as lists, so we need to convert them
-        if origin in (tuple, typing.Tuple):
-            elem_types = getattr(arg_type, "__args__", [])
+        if origin is tuple:
+            elem_types = args
             # Handle tuple of schema classes
             if all(_is_schema_class(t) for t in elem_types):
                 if isinstance(value, list) and len(value) == len(elem_types):
@@ -980,12 +1434,8 @@ class DataclassArgParser:
                 else:
                     value = tuple(value)
         # Handle list of dataclasses
-        elif (
-            origin in (list, typing.List)
-            and len(getattr(arg_type, "__args__", [])) == 1
-            and _is_schema_class(arg_type.__args__[0])
-        ):
-            elem_type = arg_type.__args__[0]
+        elif origin is list and len(args) == 1 and _is_schema_class(args[0]):
+            elem_type = args[0]
             if isinstance(value, list):
                 new_list = []
                 for v in value:
@@ -1031,56 +1481,51 @@ class DataclassArgParser:
                 return
             arg_type = inner_type
 
+        # Handle basic types (int, float, bool, str) before any generic
+        # introspection; they are by far the most common field and element types
+        check = _scalar_value_check(arg_type)
+        if check is not None:
+            if not check(value):
+                raise TypeError(
+                    f"Field '{field_name}' expects {arg_type.__name__}, "
+                    f"got {type(value).__name__}: {value!r}"
+                )
+            return
+
         # Skip validation for nested schema classes (handled at instantiation)
         if _is_schema_class(arg_type) and not isinstance(arg_type, type):
             return
         if _is_pydantic_model(arg_type):
             return
 
-        # Handle basic types
-        if arg_type is int:
-            if not isinstance(value, int) or isinstance(value, bool):
-                raise TypeError(
-                    f"Field '{field_name}' expects int, got {type(value).__name__}: {value!r}"
-                )
-        elif arg_type is float:
-            if not isinstance(value, (int, float)) or isinstance(value, bool):
-                raise TypeError(
-                    f"Field '{field_name}' expects float, got {type(value).__name__}: {value!r}"
-                )
-        elif arg_type is bool:
-            if not isinstance(value, bool):
-                raise TypeError(
-                    f"Field '{field_name}' expects bool, got {type(value).__name__}: {value!r}"
-                )
-        elif arg_type is str:
-            if not isinstance(value, str):
-                raise TypeError(
-                    f"Field '{field_name}' expects str, got {type(value).__name__}: {value!r}"
-                )
-
         # Handle List types
-        origin = getattr(arg_type, "__origin__", None)
-        if origin in (list, typing.List):
+        origin = typing.get_origin(arg_type)
+        args = typing.get_args(arg_type)
+        if origin is list:
             if not isinstance(value, list):
                 raise TypeError(
                     f"Field '{field_name}' expects list, got {type(value).__name__}: {value!r}"
                 )
-            if hasattr(arg_type, "__args__") and arg_type.__args__:
-                elem_type = arg_type.__args__[0]
+            if args:
+                elem_type = args[0]
+                # Basic elements are checked in one pass; the per-element walk
+                # below only runs to report the first bad element
+                elem_check = _scalar_value_check(elem_type)
+                if elem_check is not None and all(map(elem_check, value)):
+                    return
                 # Skip if element type is a dataclass
                 if not dataclasses.is_dataclass(elem_type):
                     for i, elem in enumerate(value):
                         self._validate_type(elem, elem_type, f"{field_name}[{i}]")
 
         # Handle Tuple types
-        elif origin in (tuple, typing.Tuple):
+        elif origin is tuple:
             if not isinstance(value, (list, tuple)):
                 raise TypeError(
                     f"Field '{field_name}' expects tuple, got {type(value).__name__}: {value!r}"
                 )
-            if hasattr(arg_type, "__args__") and arg_type.__args__:
-                elem_types = arg_type.__args__
+            if args:
+                elem_types = args
                 # Skip if all element types are dataclasses
                 if not all(dataclasses.is_dataclass(t) for t in elem_types):
                     if len(value) != len(elem_types):
@@ -1093,23 +1538,30 @@ class DataclassArgParser:
                             self._validate_type(elem, elem_type, f"{field_name}[{i}]")
 
         # Handle Dict types
-        elif origin in (dict, typing.Dict):
+        elif origin is dict:
             if not isinstance(value, dict):
                 raise TypeError(
                     f"Field '{field_name}' expects dict, got {type(value).__name__}: {value!r}"
                 )
-            if hasattr(arg_type, "__args__") and arg_type.__args__:
-                key_type = arg_type.__args__[0] if len(arg_type.__args__) >= 1 else str
-                value_type = (
-                    arg_type.__args__[1] if len(arg_type.__args__) >= 2 else str
-                )
+            if args:
+                key_type = args[0]
+                value_type = args[1] if len(args) >= 2 else str
+                key_check = _scalar_value_check(key_type)
+                value_check = _scalar_value_check(value_type)
+                if (
+                    key_check is not None
+                    and value_check is not None
+                    and all(map(key_check, value))
+                    and all(map(value_check, value.values()))
+                ):
+                    return
                 for k, v in value.items():
                     self._validate_type(k, key_type, f"{field_name} key '{k}'")
                     self._validate_type(v, value_type, f"{field_name}['{k}']")
 
         # Handle Literal types
         elif origin is Literal:
-            choices = getattr(arg_type, "__args__", ())
+            choices = args
             if value not in choices:
                 raise ValueError(
                     f"Field '{field_name}' expects one of {choices}, got {value!r}"
@@ -1120,7 +1572,7 @@ class DataclassArgParser:
         cls_nested: Type[Any],
         prefix_nested: str,
         config_nested: dict[str, Any],
-        parsed_args: dict[str, Any],
+        cli_values: dict[str, dict[str, Any]],
         config_data: dict[str, Any],
     ) -> Any:
         """
@@ -1128,18 +1580,20 @@ class DataclassArgParser:
         """
         vals = {}
         missing_fields = []
-        for f in _get_schema_fields(cls_nested):
-            k_cli = f"{prefix_nested}.{f.name}"
+        cli_section = cli_values.get(prefix_nested, {})
+        for plan in self._get_plans(cls_nested, prefix_nested):
+            f = plan.field
+            k_cli = plan.arg_key
             # CLI
-            if k_cli in parsed_args and parsed_args[k_cli] is not None:
-                vals[f.name] = parsed_args[k_cli]
+            if f.name in cli_section:
+                vals[f.name] = cli_section[f.name]
             # Nested CLI (for deeper nesting)
-            elif any(key.startswith(f"{k_cli}.") for key in parsed_args):
+            elif k_cli in self._nested_children:
                 vals[f.name] = self._merge_nested(
-                    cast(Type[Any], f.type),
+                    plan.nested_type,
                     k_cli,
                     config_nested.get(f.name, {}),
-                    parsed_args,
+                    cli_values,
                     config_data,
                 )
             # Config
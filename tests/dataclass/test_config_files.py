@@ -8,6 +8,8 @@ command-line override functionality.
 
 import json
 import os
+import subprocess
+import sys
 import tempfile
 import textwrap
 from dataclasses import dataclass, field
@@ -227,6 +229,89 @@ class TestConfigFiles:
         finally:
             os.unlink(config_path)
 
+    def test_json_config_does_not_import_yaml(self):
+        """Test that PyYAML is only imported when a YAML config is loaded."""
+        code = textwrap.dedent(
+            """
+            import json, os, sys, tempfile
+            from dataclasses import dataclass
+            from dataclass_argparser import DataclassArgParser
+
+            @dataclass
+            class Config:
+                count: int = 1
+
+            with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+                json.dump({"Config": {"count": 2}}, f)
+            try:
+                result = DataclassArgParser(Config).parse(["--config", f.name])
+            finally:
+                os.unlink(f.name)
+            assert result["Config"].count == 2
+            assert "yaml" not in sys.modules
+            """
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_json_config_with_nan_value(self):
+        """Test that JSON accepted by the standard library decoder still loads."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write('{"SampleConfig": {"threshold": NaN}}')
+            config_path = f.name
+
+        try:
+            parser = DataclassArgParser(SampleConfig)
+            result = parser.parse(["--config", config_path])
+            threshold = result["SampleConfig"].threshold
+            assert threshold != threshold  # NaN
+        finally:
+            os.unlink(config_path)
+
+    def test_invalid_json_config(self):
+        """Test that a malformed JSON file raises ValueError."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write('{"SampleConfig": {"name": }')
+            config_path = f.name
+
+        try:
+            parser = DataclassArgParser(SampleConfig)
+            with pytest.raises(ValueError, match="Invalid JSON file"):
+                parser.parse(["--config", config_path])
+        finally:
+            os.unlink(config_path)
+
+    def test_missing_config_file(self):
+        """Test that a missing config file raises FileNotFoundError."""
+        parser = DataclassArgParser(SampleConfig)
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            parser.parse(["--config", "does_not_exist.json"])
+
+    def test_invalid_yaml_config(self):
+        """Test that a malformed YAML file raises ValueError."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write("SampleConfig: {name: [unclosed\n")
+            config_path = f.name
+
+        try:
+            parser = DataclassArgParser(SampleConfig)
+            with pytest.raises(ValueError, match="Invalid YAML file"):
+                parser.parse(["--config", config_path])
+        finally:
+            os.unlink(config_path)
+
+    def test_unsupported_config_format(self):
+        """Test that an unknown config file extension raises ValueError."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write("name = 'x'\n")
+            config_path = f.name
+
+        try:
+            parser = DataclassArgParser(SampleConfig)
+            with pytest.raises(ValueError, match="Unsupported file format: .toml"):
+                parser.parse(["--config", config_path])
+        finally:
+            os.unlink(config_path)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -100,3 +100,21 @@ def test_conflict_between_constructor_and_add_flag_raises():
     res = parser.parse(["--conflict", "--SampleConfigForFlags.string_field", "x"])
     assert "conflict" in res
     assert res.get("conflict") is True
+
+
+@pytest.mark.parametrize(
+    "name", ["-h", "--help", "--config", "--SampleConfigForFlags.string_field"]
+)
+def test_add_flag_conflicting_with_builtin_or_generated_names_raises(name):
+    parser = DataclassArgParser(SampleConfigForFlags)
+
+    with pytest.raises(ValueError, match="Flag name conflict"):
+        parser.add_flag(name, action="store_true")
+
+
+def test_add_flag_conflicting_with_argument_added_on_underlying_parser_raises():
+    parser = DataclassArgParser(SampleConfigForFlags)
+    parser.parser.add_argument("--extra", action="store_true")
+
+    with pytest.raises(ValueError, match="Flag name conflict: --extra"):
+        parser.add_flag("-e", "--extra", action="store_true")
@@ -351,3 +351,28 @@ def test_dict_cli_help_text():
 
     # Check that default values are shown
     assert "default:" in help_text
+
+
+@dataclasses.dataclass
+class BoolDictConfig:
+    flags: dict[str, bool] = dataclasses.field(default_factory=dict)
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("a=True,b=False", {"a": True, "b": False}),
+        ("a=true,b=false", {"a": True, "b": False}),
+        ("a=1,b=0", {"a": True, "b": False}),
+    ],
+)
+def test_dict_bool_values_key_value_format(raw, expected):
+    parser = DataclassArgParser(BoolDictConfig)
+    cfg = parser.parse(["--BoolDictConfig.flags", raw])["BoolDictConfig"]
+    assert cfg.flags == expected
+
+
+def test_dict_bool_values_reject_other_strings():
+    parser = DataclassArgParser(BoolDictConfig)
+    with pytest.raises(SystemExit):
+        parser.parse(["--BoolDictConfig.flags", "a=maybe"])
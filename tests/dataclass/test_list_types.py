@@ -1,4 +1,5 @@
 import dataclasses
+from typing import Annotated
 import pytest
 from dataclass_argparser.parser import DataclassArgParser
 
@@ -55,3 +56,55 @@ def test_list_cli_variants(cli, expected):
     else:
         cfg = parser.parse(cli)["ListConfig"]
         assert cfg.names == expected
+
+
+@dataclasses.dataclass
+class ScalarListConfig:
+    ints: list[int] = dataclasses.field(default_factory=list)
+    floats: list[float] = dataclasses.field(default_factory=list)
+    flags: list[bool] = dataclasses.field(default_factory=list)
+
+
+@pytest.mark.parametrize(
+    "cli,field_name,expected",
+    [
+        (["--ScalarListConfig.ints", "1,+2,-3"], "ints", [1, 2, -3]),
+        (["--ScalarListConfig.ints", "0x10,1e3,2.9"], "ints", [16, 1000, 2]),
+        (["--ScalarListConfig.floats", "1,2.5,-3e2"], "floats", [1.0, 2.5, -300.0]),
+        (
+            ["--ScalarListConfig.flags", "True,false,1,0"],
+            "flags",
+            [True, False, True, False],
+        ),
+    ],
+)
+def test_list_scalar_element_spellings(cli, field_name, expected):
+    parser = DataclassArgParser(ScalarListConfig)
+    cfg = parser.parse(cli)["ScalarListConfig"]
+    assert getattr(cfg, field_name) == expected
+
+
+def test_list_bool_invalid_element():
+    parser = DataclassArgParser(ScalarListConfig)
+    with pytest.raises(SystemExit):
+        parser.parse(["--ScalarListConfig.flags", "True,maybe"])
+
+
+def test_list_argument_parsers_shared_across_parsers():
+    first = DataclassArgParser(ListConfig)
+    second = DataclassArgParser(ListConfig)
+    first_types = {a.dest: a.type for a in first.parser._actions}
+    second_types = {a.dest: a.type for a in second.parser._actions}
+    assert first_types["ListConfig.numbers"] is second_types["ListConfig.numbers"]
+
+
+def test_list_of_unhashable_annotated_elements():
+    @dataclasses.dataclass
+    class UnitConfig:
+        xs: list[Annotated[int, {"unit": "s"}]] = dataclasses.field(
+            default_factory=list
+        )
+
+    parser = DataclassArgParser(UnitConfig)
+    result = parser.parse(["--UnitConfig.xs", "1,2"])
+    assert result["UnitConfig"].xs == [1, 2]
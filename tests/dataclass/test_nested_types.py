@@ -1,6 +1,7 @@
 import dataclasses
 import json
 import pytest
+from typing import Optional
 from dataclass_argparser.parser import DataclassArgParser
 
 
@@ -107,6 +108,30 @@ def test_nested_override():
     assert cfg.z == 2.71
 
 
+def test_nested_arguments_not_returned_as_custom_flags():
+    parser = DataclassArgParser(Outer)
+    result = parser.parse(["--Outer.inner.x", "42"])
+    assert set(result) == {"Outer"}
+
+
+def test_nested_default_factory_not_called_at_construction():
+    calls = []
+
+    def make_inner():
+        calls.append(1)
+        return Inner()
+
+    @dataclasses.dataclass
+    class LazyOuter:
+        inner: Inner = dataclasses.field(default_factory=make_inner)
+
+    parser = DataclassArgParser(LazyOuter)
+    assert calls == []
+    cfg = parser.parse([])["LazyOuter"]
+    assert isinstance(cfg.inner, Inner)
+    assert calls == [1]
+
+
 @pytest.mark.parametrize(
     "cli,expected_x,expected_y,expected_z",
     [
@@ -326,3 +351,25 @@ def test_outer_level_two_from_config(tmp_path):
     assert len(second.inner) == 1
     assert second.inner[0].x == 3
     assert second.inner[0].y == "c"
+
+
+@dataclasses.dataclass
+class OuterWithOptionalInner:
+    inner: Optional[Inner] = dataclasses.field(default_factory=Inner)
+
+
+@dataclasses.dataclass
+class SecondaryOuterWithOptional:
+    outer: OuterWithOptionalInner = dataclasses.field(
+        default_factory=OuterWithOptionalInner
+    )
+
+
+def test_double_nested_optional_override():
+    parser = DataclassArgParser(SecondaryOuterWithOptional)
+    cfg = parser.parse(["--SecondaryOuterWithOptional.outer.inner.x", "8"])[
+        "SecondaryOuterWithOptional"
+    ]
+    assert isinstance(cfg.outer.inner, Inner)
+    assert cfg.outer.inner.x == 8
+    assert cfg.outer.inner.y == "foo"
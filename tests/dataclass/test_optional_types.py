@@ -8,6 +8,7 @@ in dataclasses, including parsing from CLI and config files.
 
 import json
 import os
+import sys
 import tempfile
 from dataclasses import dataclass, field
 from typing import Optional
@@ -418,3 +419,21 @@ class TestOptionalDataclassTypesImpl:
             assert config.inner.timeout == 10  # From config
         finally:
             os.unlink(config_path)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions need 3.10+")
+def test_pep604_optional_fields():
+    """Test that `T | None` fields are treated like Optional[T]."""
+
+    @dataclass
+    class UnionSyntaxConfig:
+        count: int | None = None
+        ratio: float | None = 0.5
+
+    parser = DataclassArgParser(UnionSyntaxConfig)
+    actions = {action.dest: action for action in parser.parser._actions}
+    assert actions["UnionSyntaxConfig.count"].metavar == "INT"
+
+    config = parser.parse(["--UnionSyntaxConfig.count", "3"])["UnionSyntaxConfig"]
+    assert config.count == 3
+    assert config.ratio == 0.5
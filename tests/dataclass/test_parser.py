@@ -2,13 +2,15 @@ import pytest
 import argparse
 import tempfile
 import os
+import subprocess
+import sys
 import json
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Annotated, Literal
 from unittest.mock import patch
 from io import StringIO
 
-from dataclass_argparser import DataclassArgParser
+from dataclass_argparser import DataclassArgParser, Help
 
 
 @dataclass
@@ -128,6 +130,30 @@ class TestDataclassArgParser:
         else:
             pytest.fail("Could not find SampleConfig.no_help_field argument")
 
+    def test_help_from_annotated_help_marker(self):
+        """Test that help text is read from an Annotated Help marker."""
+
+        @dataclass
+        class AnnotatedConfig:
+            name: Annotated[str, Help("Name of the run")]
+            count: Annotated[int, Help("Number of items")] = 3
+            both: Annotated[int, Help("ignored")] = field(
+                default=1, metadata={"help": "From metadata"}
+            )
+
+        parser = DataclassArgParser(AnnotatedConfig)
+        helps = {action.dest: action.help for action in parser.parser._actions}
+        assert helps["AnnotatedConfig.name"] == "Name of the run"
+        assert helps["AnnotatedConfig.count"] == "Number of items (default: 3)"
+        assert helps["AnnotatedConfig.both"] == "From metadata (default: 1)"
+
+        result = parser.parse(
+            ["--AnnotatedConfig.name", "run", "--AnnotatedConfig.count", "7"]
+        )
+        config = result["AnnotatedConfig"]
+        assert config.name == "run"
+        assert config.count == 7
+
     def test_literal_field_choices(self):
         """Test that Literal fields have correct choices set."""
         parser = DataclassArgParser(SampleConfig)
@@ -235,6 +261,28 @@ class TestDataclassArgParser:
         with pytest.raises(SystemExit):
             parser.parse(["--SampleConfig.literal_field", "invalid_option"])
 
+    def test_parse_into_returns_instances_in_order(self):
+        """Test that parse_into returns a tuple of instances in constructor order."""
+        parser = DataclassArgParser(SampleConfig, AnotherConfig)
+        parser.add_flag("--verbose", action="store_true")
+
+        sample, another = parser.parse_into(
+            ["--AnotherConfig.count", "3", "--verbose"]
+        )
+
+        assert isinstance(sample, SampleConfig)
+        assert isinstance(another, AnotherConfig)
+        assert sample.int_field == 42
+        assert another.count == 3
+
+    def test_parser_rejects_unknown_attributes(self):
+        """Test that the parser uses __slots__, so attribute typos fail loudly."""
+        parser = DataclassArgParser(SampleConfig)
+
+        assert not hasattr(parser, "__dict__")
+        with pytest.raises(AttributeError):
+            parser.dataclass_type = (SampleConfig,)
+
     def test_argument_names_format(self):
         """Test that argument names are formatted as --ClassName.field_name."""
         parser = DataclassArgParser(SampleConfig, AnotherConfig)
@@ -477,6 +525,27 @@ class TestDataclassArgParser:
             parser.parse(["--RequiredTupleConfig.required_tuple", "(1, 2)"])
 
 
+class TestPackageImport:
+    """Tests for the lazily-populated package namespace."""
+
+    def test_import_does_not_load_parser_module(self):
+        """Importing the package should not import the parser module."""
+        code = (
+            "import sys, dataclass_argparser; "
+            "assert 'dataclass_argparser.parser' not in sys.modules; "
+            "dataclass_argparser.DataclassArgParser; "
+            "assert 'dataclass_argparser.parser' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown package attributes should raise AttributeError."""
+        import dataclass_argparser
+
+        with pytest.raises(AttributeError):
+            dataclass_argparser.does_not_exist
+
+
 if __name__ == "__main__":
     # Allow running the test directly
     pytest.main([__file__, "-v"])
@@ -0,0 +1,55 @@
+"""Tests for dataclasses defined with `from __future__ import annotations`."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Annotated, Literal, Optional
+
+from dataclass_argparser import DataclassArgParser, Help
+
+
+@dataclass
+class PostponedInner:
+    x: int = 1
+
+
+@dataclass
+class PostponedConfig:
+    count: int = 5
+    ratio: float = 0.5
+    enabled: bool = False
+    mode: Literal["fast", "slow"] = "fast"
+    values: list[int] = field(default_factory=list)
+    name: Annotated[str, Help("The name to use")] = "test"
+    inner: Optional[PostponedInner] = field(default_factory=PostponedInner)
+
+
+def test_string_annotations_are_resolved():
+    parser = DataclassArgParser(PostponedConfig)
+    cfg = parser.parse(
+        [
+            "--PostponedConfig.count",
+            "7",
+            "--PostponedConfig.ratio",
+            "2",
+            "--PostponedConfig.enabled",
+            "true",
+            "--PostponedConfig.values",
+            "1,2,3",
+            "--PostponedConfig.inner.x",
+            "9",
+        ]
+    )["PostponedConfig"]
+    assert cfg.count == 7
+    assert cfg.ratio == 2.0
+    assert cfg.enabled is True
+    assert cfg.values == [1, 2, 3]
+    assert cfg.inner.x == 9
+
+
+def test_string_annotations_metavars_and_help():
+    parser = DataclassArgParser(PostponedConfig)
+    actions = {action.dest: action for action in parser.parser._actions}
+    assert actions["PostponedConfig.count"].metavar == "INT"
+    assert actions["PostponedConfig.mode"].choices == ("fast", "slow")
+    assert actions["PostponedConfig.name"].help == "The name to use (default: test)"
@@ -1,4 +1,5 @@
 import dataclasses
+import typing
 import pytest
 from dataclass_argparser.parser import DataclassArgParser
 
@@ -115,3 +116,27 @@ def test_tuple_type_coercion():
     result = parser.parse(["--TupleConfig.pair", "hello,42"])
     cfg = result["TupleConfig"]
     assert cfg.pair == ("hello", 42.0)  # 42 gets converted to 42.0
+
+
+@dataclasses.dataclass
+class TypingAliasConfig:
+    coords: typing.Tuple[int, int] = (0, 0)
+    names: typing.List[str] = dataclasses.field(default_factory=list)
+    weights: typing.Dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+def test_typing_module_aliases():
+    parser = DataclassArgParser(TypingAliasConfig)
+    cfg = parser.parse(
+        [
+            "--TypingAliasConfig.coords",
+            "1,2",
+            "--TypingAliasConfig.names",
+            "a,b",
+            "--TypingAliasConfig.weights",
+            "x=0.5",
+        ]
+    )["TypingAliasConfig"]
+    assert cfg.coords == (1, 2)
+    assert cfg.names == ["a", "b"]
+    assert cfg.weights == {"x": 0.5}
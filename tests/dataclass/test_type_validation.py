@@ -54,6 +54,18 @@ class DictTypesConfig:
     )
 
 
+@dataclass
+class NestedContainerConfig:
+    """Configuration with nested container types for testing type validation."""
+
+    int_list_dict: dict[str, list[int]] = field(
+        default_factory=dict, metadata={"help": "Dict of int lists"}
+    )
+    int_list_list: list[list[int]] = field(
+        default_factory=list, metadata={"help": "List of int lists"}
+    )
+
+
 class TestCLITypeValidation:
     """Test suite for CLI type validation."""
 
@@ -154,6 +166,20 @@ class TestCLITypeValidation:
         with pytest.raises(SystemExit):
             parser.parse(["--DictTypesConfig.str_float_dict", "key1=not_float"])
 
+    def test_dict_of_int_lists_with_string_element_cli(self):
+        """Test that nested elements of a dict value are validated from the CLI."""
+        parser = DataclassArgParser(NestedContainerConfig)
+
+        with pytest.raises(TypeError, match=r"int_list_dict\['a'\]\[1\]' expects int"):
+            parser.parse(["--NestedContainerConfig.int_list_dict", '{"a": [1, "x"]}'])
+
+    def test_list_of_int_lists_cli(self):
+        """Test that list elements the CLI converter cannot type are rejected."""
+        parser = DataclassArgParser(NestedContainerConfig)
+
+        with pytest.raises(TypeError, match=r"int_list_list\[0\]\[0\]' expects int"):
+            parser.parse(["--NestedContainerConfig.int_list_list", "1,2"])
+
 
 class TestConfigFileTypeValidation:
     """Test suite for config file type validation."""
@@ -293,6 +319,28 @@ class TestConfigFileTypeValidation:
         finally:
             os.unlink(config_path)
 
+    def test_container_error_names_first_bad_element_config(self):
+        """Test that container errors name the first element that fails."""
+        config_data = {
+            "ListTypesConfig": {"int_list": [1, 2, "three", "four"]},
+            "DictTypesConfig": {"str_int_dict": {"a": 1, "b": "two"}},
+        }
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(config_data, f)
+            config_path = f.name
+
+        try:
+            parser = DataclassArgParser(ListTypesConfig)
+            with pytest.raises(TypeError, match=r"int_list\[2\]' expects int"):
+                parser.parse(["--config", config_path])
+
+            parser = DataclassArgParser(DictTypesConfig)
+            with pytest.raises(TypeError, match=r"str_int_dict\['b'\]' expects int"):
+                parser.parse(["--config", config_path])
+        finally:
+            os.unlink(config_path)
+
 
 class TestYAMLConfigTypeValidation:
     """Test suite for YAML config file type validation."""
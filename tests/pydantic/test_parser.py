@@ -10,14 +10,14 @@ import io
 import json
 import os
 import tempfile
-from typing import Literal
+from typing import Annotated, Literal
 from unittest.mock import patch
 
 import pytest
 
 from pydantic import BaseModel, Field
 
-from dataclass_argparser import DataclassArgParser
+from dataclass_argparser import DataclassArgParser, Help
 
 
 class SampleConfig(BaseModel):
@@ -89,6 +89,18 @@ class TestArgParser:
         assert "An integer field for testing" in help_text
         assert "default_value" in help_text
 
+    def test_help_extraction_from_annotated_help(self):
+        """Test that help text is extracted from an Annotated Help marker."""
+
+        class AnnotatedConfig(BaseModel):
+            count: Annotated[int, Help("Number of items")] = 3
+
+        parser = DataclassArgParser(AnnotatedConfig)
+
+        help_text = parser.parser.format_help()
+        assert "Number of items (default: 3)" in help_text
+        assert parser.parse([])["AnnotatedConfig"].count == 3
+
     def test_parse_with_defaults(self):
         """Test parsing with all default values."""
         parser = DataclassArgParser(SampleConfig)